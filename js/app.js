@@ -3,6 +3,7 @@ import { Store } from './store.js?v=15';
 import { UI } from './ui.js?v=15';
 import { getFormations } from './formations.js?v=15';
 import { AuthManager } from './auth.js?v=15';
+import { sourceSchemaVersion } from './play-schema.js';
 
 class App {
     constructor() {
@@ -43,6 +44,8 @@ class App {
                 if (templateId) {
                     console.log('Storing pending template:', templateId);
                     localStorage.setItem('pending_template_id', templateId);
+                    const templateSrc = urlParams.get('template_src');
+                    if (templateSrc) localStorage.setItem('pending_template_src', templateSrc);
                     // Show signup form with context
                     this.switchView('auth');
                     this.toggleAuthForms('signup');
@@ -97,18 +100,21 @@ class App {
 
         // Check for pending template from localStorage (stored before auth)
         let templateId = localStorage.getItem('pending_template_id');
+        let templateSrc = localStorage.getItem('pending_template_src');
         if (templateId) {
             localStorage.removeItem('pending_template_id'); // Clear it
+            localStorage.removeItem('pending_template_src');
             console.log('Processing pending template from localStorage:', templateId);
         } else {
             // Check for template_id in URL as fallback
             const urlParams = new URLSearchParams(window.location.search);
             templateId = urlParams.get('template_id');
+            templateSrc = urlParams.get('template_src');
         }
 
         if (templateId) {
             console.log('Loading template:', templateId);
-            await this.handleTemplateFlow(templateId);
+            await this.handleTemplateFlow(templateId, templateSrc);
             this.initEventListeners();
             return;
         }
@@ -130,10 +136,16 @@ class App {
         this.initEventListeners();
     }
 
-    async handleTemplateFlow(templateId) {
+    async handleTemplateFlow(templateId, templateSrc = null) {
         try {
-            // 1. Fetch template play with team size
-            const templatePlay = await this.store.getPublicPlayWithTeamSize(templateId);
+            // 1. Fetch template play with team size (static JSON from the CDN when available)
+            let templatePlay = null;
+            if (templateSrc) {
+                templatePlay = await this.store.getStaticTemplate(templateSrc, templateId);
+            }
+            if (!templatePlay) {
+                templatePlay = await this.store.getPublicPlayWithTeamSize(templateId);
+            }
 
             if (!templatePlay) {
                 console.error('Template not found:', templateId);
@@ -173,7 +185,8 @@ class App {
                 formation: templatePlay.formation || 'Custom',
                 players: templatePlay.players || [],
                 routes: templatePlay.routes || [],
-                icons: templatePlay.icons || []
+                icons: templatePlay.icons || [],
+                schema_version: sourceSchemaVersion(templatePlay)
             };
 
             const savedPlay = await this.store.savePlay(targetPlaybook.id, newPlay);
@@ -188,6 +201,7 @@ class App {
             // Clean up URL to remove template_id parameter
             const url = new URL(window.location);
             url.searchParams.delete('template_id');
+            url.searchParams.delete('template_src');
             window.history.replaceState({}, '', url);
 
         } catch (err) {
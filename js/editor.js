@@ -1,3 +1,5 @@
+import { PLAY_SCHEMA_VERSION } from './play-schema.js';
+
 export class Editor {
     constructor(canvasId) {
         this.svg = document.getElementById(canvasId);
@@ -151,6 +153,8 @@ export class Editor {
             }
             play.migrated = true;
         }
+        // The editor works in the current schema, so saving this play stores the current version
+        play.schema_version = PLAY_SCHEMA_VERSION;
 
         if (play.players) {
             play.players.forEach(p => {
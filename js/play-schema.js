@@ -0,0 +1,9 @@
+// Schema version of the play data the app writes (plays.data.schema_version).
+// Must equal current_version() in scripts/play_migrations.py: bump both when registering a migration,
+// and teach Editor.loadData() to upgrade older data in memory the same way.
+export const PLAY_SCHEMA_VERSION = 1;
+
+// Version to store for a copied play: its own, since copies keep the source data as-is (0 = unversioned)
+export function sourceSchemaVersion(play) {
+    return play.schema_version || 0;
+}
@@ -1,4 +1,5 @@
 import { supabase } from './supabase.js';
+import { PLAY_SCHEMA_VERSION, sourceSchemaVersion } from './play-schema.js';
 
 export class Store {
     constructor() {
@@ -178,6 +179,8 @@ export class Store {
         // Schema: name, data (jsonb)
         // We pack everything else into data
         const playData = {
+            // Plays edited or created in the app are current; copies carry their source's version
+            schema_version: play.schema_version ?? PLAY_SCHEMA_VERSION,
             formation: play.formation,
             players: play.players,
             routes: play.routes,
@@ -268,6 +271,25 @@ export class Store {
         return mappedPlay;
     }
 
+    async getStaticTemplate(src, playId) {
+        // Static template JSON emitted by scripts/build_templates.py (already in percentage coordinates)
+        // Only same-origin /play-templates/api/ paths are accepted
+        if (!src.startsWith('/play-templates/api/')) return null;
+        try {
+            const response = await fetch(src);
+            if (!response.ok) return null;
+            const doc = await response.json();
+            if (doc.id !== playId) return null;
+
+            const mappedPlay = this._mapPlay(doc);
+            mappedPlay.teamSize = doc.team_size;
+            return mappedPlay;
+        } catch (err) {
+            console.error('Error fetching static template:', err);
+            return null;
+        }
+    }
+
     async deletePlay(playId) {
         const { error } = await supabase
             .from('plays')
@@ -491,6 +513,7 @@ export class Store {
                 players: play.players,
                 routes: play.routes,
                 icons: play.icons,
+                schema_version: sourceSchemaVersion(play),
                 order: i
             };
             await this.savePlay(savedPlaybook.id, newPlay);
@@ -540,6 +563,7 @@ export class Store {
                 players: play.players,
                 routes: play.routes,
                 icons: play.icons || [],
+                schema_version: sourceSchemaVersion(play),
                 order: startingOrder + i
             };
 
@@ -0,0 +1,115 @@
+// Client-side search over the static index emitted by scripts/build_templates.py.
+// Loads the manifest once, then fetches only the shards needed for each query term;
+// each shard carries the metadata of the plays it matches, keyed by play id.
+(function () {
+    const INDEX_URL = '/play-templates/search/';
+    const MAX_RESULTS = 20;
+
+    const input = document.getElementById('template-search-input');
+    const resultsEl = document.getElementById('template-search-results');
+    if (!input || !resultsEl) return;
+
+    let manifestPromise = null;
+    const shardCache = {};
+
+    function loadManifest() {
+        if (!manifestPromise) {
+            manifestPromise = fetch(INDEX_URL + 'manifest.json').then(r => r.json());
+        }
+        return manifestPromise;
+    }
+
+    function loadShard(key) {
+        if (!shardCache[key]) {
+            shardCache[key] = fetch(INDEX_URL + key + '.json').then(r => r.json());
+        }
+        return shardCache[key];
+    }
+
+    function shardKey(term) {
+        return /[0-9]/.test(term[0]) ? '0' : term[0];
+    }
+
+    function parseQuery(query) {
+        // Facets ("players:5", "format:7v7") stay intact; everything else is tokenized
+        return query.toLowerCase().split(/\s+/).flatMap(part => {
+            if (/^[a-z]+:[a-z0-9]+$/.test(part)) return [part];
+            return part.match(/[a-z0-9]+/g) || [];
+        }).filter(t => t.length >= 2 || t.includes(':'));
+    }
+
+    async function search(query) {
+        const terms = parseQuery(query);
+        if (terms.length === 0) return [];
+
+        const manifest = await loadManifest();
+        const docs = {};
+        let scores = null;
+
+        for (const term of terms) {
+            const key = shardKey(term);
+            if (!manifest.shards.includes(key)) return [];
+            const shard = await loadShard(key);
+            Object.assign(docs, shard.docs);
+
+            // Prefix match for free text, exact match for facets
+            const termScores = {};
+            for (const token in shard.tokens) {
+                const matches = term.includes(':') ? token === term : token.startsWith(term);
+                if (!matches) continue;
+                for (const [docId, weight] of shard.tokens[token]) {
+                    termScores[docId] = Math.max(termScores[docId] || 0, weight);
+                }
+            }
+
+            // AND semantics across terms
+            if (scores === null) {
+                scores = termScores;
+            } else {
+                for (const docId in scores) {
+                    if (!(docId in termScores)) delete scores[docId];
+                    else scores[docId] += termScores[docId];
+                }
+            }
+        }
+
+        return Object.entries(scores || {})
+            .sort((a, b) => b[1] - a[1])
+            .slice(0, MAX_RESULTS)
+            .map(([docId]) => docs[docId]);
+    }
+
+    function escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function render(docs, query) {
+        if (!query.trim()) {
+            resultsEl.innerHTML = '';
+            return;
+        }
+        if (docs.length === 0) {
+            resultsEl.innerHTML = '<p class="search-empty">No plays found.</p>';
+            return;
+        }
+        resultsEl.innerHTML = docs.map(doc => `
+            <a href="${doc.u}" class="search-result">
+                <strong>${escapeHtml(doc.n)}</strong>
+                <span>${escapeHtml(doc.f)} &middot; ${escapeHtml(doc.p)}${doc.fm ? ' &middot; ' + escapeHtml(doc.fm) : ''}</span>
+            </a>
+        `).join('');
+    }
+
+    let latest = 0;
+    input.addEventListener('input', async () => {
+        const query = input.value;
+        const requestId = ++latest;
+        const docs = await search(query);
+        if (requestId === latest) render(docs, query);
+    });
+
+    // Warm the manifest as soon as the user shows intent
+    input.addEventListener('focus', loadManifest, { once: true });
+})();
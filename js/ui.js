@@ -1,6 +1,7 @@
 import { getFormations } from './formations.js';
 import { PrintModule } from './print.js';
 import { supabase } from './supabase.js';
+import { PLAY_SCHEMA_VERSION } from './play-schema.js';
 
 export class UI {
     constructor(store, app) {
@@ -1090,6 +1091,7 @@ export class UI {
             }
             play.migrated = true;
         }
+        play.schema_version = PLAY_SCHEMA_VERSION;
 
         // Create unique ID suffix for this SVG to avoid conflicts
         const uniqueId = `svg_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
@@ -0,0 +1,86 @@
+"""
+Content-hashed copies of static assets referenced by generated pages.
+
+`AssetManifest.url('/css/templates.css')` returns '/css/templates.3f9a1c2b.css'
+and writes that copy next to the original the first time it is requested.
+Because the name changes whenever the content does, the hashed files can be
+served with long-lived immutable cache headers.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+
+HASH_LENGTH = 8
+
+
+def _hashed_name(filename, digest):
+    stem, ext = os.path.splitext(filename)
+    return f'{stem}.{digest}{ext}'
+
+
+def _is_hashed_copy(name, filename):
+    stem, ext = os.path.splitext(filename)
+    return re.fullmatch(re.escape(stem) + r'\.[0-9a-f]{%d}' % HASH_LENGTH + re.escape(ext), name) is not None
+
+
+class AssetManifest:
+    def __init__(self, base_dir, enabled=True):
+        self.base_dir = base_dir
+        self.enabled = enabled
+        self.urls = {}
+
+    def url(self, path):
+        """Fingerprinted URL for a root-relative asset path; unknown files are returned unchanged"""
+        if not self.enabled:
+            return path
+        if path in self.urls:
+            return self.urls[path]
+
+        source = os.path.join(self.base_dir, path.lstrip('/'))
+        if not os.path.isfile(source):
+            self.urls[path] = path
+            return path
+
+        with open(source, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+
+        directory, filename = os.path.split(source)
+        hashed = _hashed_name(filename, digest)
+        target = os.path.join(directory, hashed)
+        if not os.path.exists(target):
+            shutil.copyfile(source, target)
+
+        self.urls[path] = path[:len(path) - len(filename)] + hashed
+        return self.urls[path]
+
+    def prune(self, keep=()):
+        """
+        Remove hashed copies of older versions; only safe after every page has been regenerated.
+
+        URLs in `keep` (normally the previous build's manifest) survive too, so
+        HTML cached by browsers and CDNs before this deploy can still load them.
+        """
+        keep = set(keep)
+        for path, url in self.urls.items():
+            if path == url:
+                continue
+            directory, filename = os.path.split(os.path.join(self.base_dir, path.lstrip('/')))
+            prefix = url[:len(url) - len(os.path.basename(url))]
+            for name in os.listdir(directory):
+                if _is_hashed_copy(name, filename) and prefix + name != url and prefix + name not in keep:
+                    os.remove(os.path.join(directory, name))
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(dict(sorted(self.urls.items())), f, indent=1)
+
+    @staticmethod
+    def load_urls(path):
+        """{asset path: hashed URL} from a saved manifest, empty if there is none"""
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r') as f:
+            return json.load(f)
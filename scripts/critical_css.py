@@ -0,0 +1,125 @@
+"""
+Critical CSS extraction for generated pages.
+
+Parses the site stylesheets once, then for each page type keeps only the
+rules whose selectors can match the tags, classes and ids present in that
+page's markup. The subset is computed once per page type from the union
+of the markup of every page of that type (so conditional blocks such as the
+official collection header are covered) and shared by all of them.
+"""
+
+import os
+import re
+
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+HTML_TAG_RE = re.compile(r'<([a-zA-Z][a-zA-Z0-9-]*)')
+HTML_CLASS_RE = re.compile(r'\bclass="([^"]*)"')
+HTML_ID_RE = re.compile(r'\bid="([^"]*)"')
+
+# Pseudo-classes/elements and attribute selectors don't affect whether a rule can apply
+SELECTOR_NOISE_RE = re.compile(r'::?[a-zA-Z-]+(\([^)]*\))?|\[[^\]]*\]')
+SELECTOR_TOKEN_RE = re.compile(r'([.#]?)(-?[_a-zA-Z][_a-zA-Z0-9-]*)')
+KEYFRAMES_RE = re.compile(r'@(-webkit-)?keyframes\s+([^\s{]+)')
+
+ALWAYS_KEEP_TAGS = {'html', 'body'}
+GROUPING_AT_RULES = ('@media', '@supports')
+
+
+def parse_blocks(css):
+    """Split CSS into top-level (prelude, body) pairs; body is None for statements like @import"""
+    blocks = []
+    i = 0
+    start = 0
+    n = len(css)
+    while i < n:
+        ch = css[i]
+        if ch == ';' and css[start:i].strip().startswith('@'):
+            blocks.append((css[start:i].strip(), None))
+            start = i + 1
+        elif ch == '{':
+            depth = 1
+            j = i + 1
+            while j < n and depth:
+                if css[j] == '{':
+                    depth += 1
+                elif css[j] == '}':
+                    depth -= 1
+                j += 1
+            blocks.append((css[start:i].strip(), css[i + 1:j - 1]))
+            i = j
+            start = j
+            continue
+        i += 1
+    return blocks
+
+
+def page_tokens(html):
+    tokens = {tag.lower() for tag in HTML_TAG_RE.findall(html)}
+    for classes in HTML_CLASS_RE.findall(html):
+        tokens.update('.' + c for c in classes.split())
+    for ids in HTML_ID_RE.findall(html):
+        tokens.add('#' + ids.strip())
+    return tokens | ALWAYS_KEEP_TAGS
+
+
+def selector_matches(selector, tokens):
+    selector = SELECTOR_NOISE_RE.sub('', selector)
+    for prefix, name in SELECTOR_TOKEN_RE.findall(selector):
+        token = prefix + (name if prefix else name.lower())
+        if token not in tokens:
+            return False
+    return True
+
+
+class CriticalCss:
+    def __init__(self, base_dir, stylesheets, enabled=False):
+        self.base_dir = base_dir
+        self.stylesheets = stylesheets
+        self.enabled = enabled
+        self.cache = {}
+        self._blocks = None
+
+    def blocks(self):
+        if self._blocks is None:
+            self._blocks = []
+            for path in self.stylesheets:
+                with open(os.path.join(self.base_dir, path.lstrip('/')), 'r') as f:
+                    self._blocks.extend(parse_blocks(COMMENT_RE.sub('', f.read())))
+        return self._blocks
+
+    def _filter(self, blocks, tokens):
+        out = []
+        keyframes = []
+        for prelude, body in blocks:
+            if body is None:
+                continue
+            if prelude.startswith(GROUPING_AT_RULES):
+                inner = self._filter(parse_blocks(body), tokens)
+                if inner:
+                    out.append(f'{prelude}{{{inner}}}')
+            elif KEYFRAMES_RE.match(prelude):
+                keyframes.append((KEYFRAMES_RE.match(prelude).group(2), prelude, body))
+            elif prelude.startswith('@'):
+                out.append(f'{prelude}{{{body.strip()}}}')
+            else:
+                selectors = [s.strip() for s in prelude.split(',') if selector_matches(s, tokens)]
+                if selectors:
+                    out.append(f"{','.join(selectors)}{{{' '.join(body.split())}}}")
+
+        css = ''.join(out)
+        # Keep only animations that a kept rule actually uses
+        for name, prelude, body in keyframes:
+            if name in css:
+                css += f"{prelude}{{{' '.join(body.split())}}}"
+        return css
+
+    def get(self, page_type):
+        return self.cache.get(page_type)
+
+    def for_pages(self, page_type, pages):
+        """Compute and cache the critical CSS for `page_type` from the markup of all its pages"""
+        tokens = set()
+        for html in pages:
+            tokens |= page_tokens(html)
+        self.cache[page_type] = self._filter(self.blocks(), tokens)
+        return self.cache[page_type]
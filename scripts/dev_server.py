@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the play-templates build.
+
+Serves the site locally, watches the generator scripts, a local playbook
+snapshot, the strategy sources and the CSS, and rebuilds only the affected pages in-process,
+using the same page dependency graph as incremental builds (page_deps.py).
+Parsed data and the SVG render cache stay warm between rebuilds, and open
+browsers reload automatically via a server-sent events endpoint.
+
+Pages are written to .build-cache/dev-site rather than the published tree:
+they are built from the snapshot without asset fingerprinting, and the
+incremental build state (page-deps.json, url-hashes.json) never sees them.
+
+Usage:
+    python scripts/build_templates.py --watch [--snapshot playbooks.json] [--port 8080]
+"""
+
+import http.server
+import importlib
+import os
+import sys
+import threading
+import time
+import urllib.parse
+
+import build_templates as bt
+from page_deps import code_dependencies
+
+POLL_INTERVAL = 0.2
+RELOAD_PATH = '/__reload'
+DEFAULT_SNAPSHOT = os.path.join(bt.BASE_DIR, '.build-cache', 'playbooks.json')
+
+DEV_SITE_DIR = os.path.join(bt.BASE_DIR, '.build-cache', 'dev-site')
+GENERATED_PATHS = (bt.ROOT_PATH, bt.STRATEGY_PATH)
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CSS_DIR = os.path.join(bt.BASE_DIR, 'css')
+
+RELOAD_SNIPPET = (
+    f"<script>new EventSource('{RELOAD_PATH}').onmessage = () => location.reload();</script>"
+)
+
+
+def use_dev_site():
+    """Point the build at the dev output tree, with live (unhashed) asset URLs so CSS edits show up on reload"""
+    bt.OUTPUT_DIR = os.path.join(DEV_SITE_DIR, *bt.ROOT_PATH.strip('/').split('/'))
+    bt.STRATEGY_DIR = os.path.join(DEV_SITE_DIR, *bt.STRATEGY_PATH.strip('/').split('/'))
+    bt.ASSETS.enabled = False
+
+
+class ReloadBroadcaster:
+    def __init__(self):
+        self.version = 0
+        self.cond = threading.Condition()
+
+    def notify(self):
+        with self.cond:
+            self.version += 1
+            self.cond.notify_all()
+
+    def wait(self, seen, timeout=15):
+        with self.cond:
+            self.cond.wait_for(lambda: self.version != seen, timeout=timeout)
+            return self.version
+
+
+def make_handler(broadcaster):
+    class DevHandler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=bt.BASE_DIR, **kwargs)
+
+        def log_message(self, format, *args):
+            pass
+
+        def translate_path(self, path):
+            # Generated pages come from the dev build, everything else from the repo
+            generated = urllib.parse.urlsplit(path).path.startswith(GENERATED_PATHS)
+            self.directory = DEV_SITE_DIR if generated else bt.BASE_DIR
+            return super().translate_path(path)
+
+        def do_GET(self):
+            if self.path == RELOAD_PATH:
+                return self.serve_events()
+
+            path = self.translate_path(self.path)
+            if os.path.isdir(path):
+                path = os.path.join(path, 'index.html')
+            if path.endswith('.html') and os.path.isfile(path):
+                return self.serve_html(path)
+            return super().do_GET()
+
+        def serve_html(self, path):
+            with open(path, 'r') as f:
+                html = f.read()
+            html = html.replace('</body>', RELOAD_SNIPPET + '</body>', 1)
+            body = html.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def serve_events(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            seen = broadcaster.version
+            try:
+                while True:
+                    version = broadcaster.wait(seen)
+                    if version != seen:
+                        seen = version
+                        self.wfile.write(b'data: reload\n\n')
+                    else:
+                        self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return DevHandler
+
+
+class Watcher:
+    def __init__(self, snapshot_path, broadcaster, explain=False):
+        self.snapshot_path = snapshot_path
+        self.broadcaster = broadcaster
+        self.explain = explain
+        self.mtimes = {}
+        self.playbooks = bt.load_snapshot(snapshot_path)
+        self.graph = None
+
+    def _watched_files(self):
+        files = [self.snapshot_path]
+        files += [os.path.join(SCRIPTS_DIR, f) for f in os.listdir(SCRIPTS_DIR) if f.endswith('.py')]
+        if os.path.isdir(CSS_DIR):
+            files += [os.path.join(CSS_DIR, f) for f in os.listdir(CSS_DIR)]
+        for root, _, names in os.walk(bt.STRATEGY_SOURCE_DIR):
+            files += [os.path.join(root, f) for f in names]
+        return files
+
+    def poll(self):
+        changed = []
+        for path in self._watched_files():
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                continue
+            if self.mtimes.get(path) not in (None, mtime):
+                changed.append(path)
+            self.mtimes[path] = mtime
+        return changed
+
+    def build(self):
+        """Regenerate the pages whose inputs changed since the previous build (all of them the first time)"""
+        bt.prepare(self.playbooks)
+        graph = bt.page_dependencies()
+        stale = bt.stale_pages(graph, self.graph)
+        bt.report_stale(graph, stale, self.explain)
+        bt.generate_pages(set(stale))
+        bt.finalize()
+        self.graph = graph
+
+    def rebuild(self, changed):
+        start = time.time()
+        scripts = [p for p in changed if p.endswith('.py')]
+
+        if scripts and not self.reload_scripts(scripts):
+            return
+
+        if self.snapshot_path in changed:
+            try:
+                self.playbooks = bt.load_snapshot(self.snapshot_path)
+            except ValueError as e:
+                print(f'Snapshot is not valid JSON yet, skipping: {e}')
+                return
+
+        self.build()
+        print(f'Rebuilt in {(time.time() - start) * 1000:.0f}ms ({", ".join(os.path.basename(p) for p in changed)})')
+        self.broadcaster.notify()
+
+    def reload_scripts(self, scripts):
+        """Reload changed modules; returns False if the new code failed to import"""
+        names = {os.path.splitext(os.path.basename(p))[0] for p in scripts}
+        helpers = names - {'build_templates', 'dev_server'}
+
+        svg_cache = dict(bt.SVG_CACHE)
+        renderer = code_dependencies(bt.render_play_svg, vars(bt), bt.RUNTIME_GLOBALS)
+        try:
+            for name in helpers:
+                if name in sys.modules:
+                    importlib.reload(sys.modules[name])
+            importlib.reload(bt)
+        except Exception as e:
+            print(f'Reload failed, keeping previous build: {e}')
+            return False
+        use_dev_site()
+
+        # Changed generator functions and config entries show up in the page graph; helper
+        # modules (URL map, fingerprints, ...) can affect any page, so rebuild everything
+        if helpers:
+            self.graph = None
+
+        # Keep the render cache warm unless the renderer itself changed
+        if not helpers and renderer == code_dependencies(bt.render_play_svg, vars(bt), bt.RUNTIME_GLOBALS):
+            bt.SVG_CACHE.update(svg_cache)
+        return True
+
+
+def watch(snapshot_path=None, port=8080, explain=False):
+    snapshot_path = snapshot_path or DEFAULT_SNAPSHOT
+    if not os.path.exists(snapshot_path):
+        print(f'No snapshot at {snapshot_path}, fetching from Supabase...')
+        bt.save_snapshot(snapshot_path, bt.fetch_public_playbooks())
+
+    use_dev_site()
+
+    broadcaster = ReloadBroadcaster()
+    watcher = Watcher(snapshot_path, broadcaster, explain)
+    watcher.build()
+    watcher.poll()
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', port), make_handler(broadcaster))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f'Serving http://127.0.0.1:{port}/play-templates/ (watching {snapshot_path})')
+
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            changed = watcher.poll()
+            if not changed:
+                continue
+            if all(p.startswith(CSS_DIR) for p in changed):
+                broadcaster.notify()
+                continue
+            try:
+                watcher.rebuild(changed)
+            except Exception as e:
+                print(f'Rebuild failed: {e}')
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Supabase REST API, for exercising the scripts offline.
+
+Implements the subset of PostgREST the scripts use:
+  - GET /rest/v1/<table> with `select=*`, column lists and embedded
+    `plays(*)`, `col=eq.value` / `neq.` / `is.null` filters, `order=col[.desc]`,
+    and pagination via `Range` headers or `limit`/`offset`
+  - PATCH /rest/v1/<table>?id=eq.<id> with `Prefer: return=minimal`
+    (204) or `return=representation` (200 with the updated rows)
+
+Data is seeded from a fixture: either a playbook snapshot as written by
+`build_templates.py --save-snapshot` (playbooks with embedded plays) or a
+{table: [rows]} object. Latency, rate limiting and error injection are
+configurable and seeded: the n-th request always gets the same latency and
+failure draw, however requests interleave, so benchmarks are reproducible.
+Changes live in memory only.
+
+Usage:
+    python scripts/fake_postgrest.py fixture.json [--port 54321] [--latency 80] [--jitter 40]
+        [--error-rate 0.02] [--rate-limit 50] [--seed 1]
+    SUPABASE_URL=http://127.0.0.1:54321 python scripts/build_templates.py
+"""
+
+import argparse
+import copy
+import http.server
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+
+REST_PREFIX = '/rest/v1/'
+EMBED_RE = re.compile(r'^(\w+)\((.*)\)$')
+RANGE_RE = re.compile(r'^\s*(\d+)-(\d*)\s*$')
+
+# Child table -> column pointing at its parent row, for embedded selects like plays(*)
+FOREIGN_KEYS = {
+    'plays': 'playbook_id',
+}
+
+
+def load_fixture(path):
+    """{table: [rows]} from a snapshot (list of playbooks with plays) or a table dump"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return {table: list(rows) for table, rows in data.items()}
+
+    playbooks, plays = [], []
+    for pb in data:
+        pb = dict(pb)
+        for play in pb.pop('plays', None) or []:
+            plays.append(dict(play, playbook_id=play.get('playbook_id', pb['id'])))
+        pb.setdefault('is_public', True)
+        playbooks.append(pb)
+    return {'playbooks': playbooks, 'plays': plays, 'formations': []}
+
+
+def split_select(select):
+    """Split a select list on top-level commas: 'id,plays(id,name)' -> ['id', 'plays(id,name)']"""
+    parts, depth, current = [], 0, ''
+    for ch in select:
+        if ch == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+            continue
+        depth += (ch == '(') - (ch == ')')
+        current += ch
+    if current:
+        parts.append(current)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _literal(value):
+    return {'true': True, 'false': False, 'null': None}.get(value, value)
+
+
+def matches(row, column, condition):
+    op, _, value = condition.partition('.')
+    actual = row.get(column)
+    if op == 'is':
+        return actual is _literal(value)
+    if op in ('eq', 'neq'):
+        equal = actual == _literal(value) if isinstance(actual, bool) or actual is None else str(actual) == value
+        return equal if op == 'eq' else not equal
+    if op == 'in':
+        return str(actual) in value.strip('()').split(',')
+    raise ValueError(f'unsupported operator "{op}"')
+
+
+class FakeDatabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.lock = threading.Lock()
+
+    def _table(self, name):
+        if name not in self.tables:
+            raise KeyError(name)
+        return self.tables[name]
+
+    def _project(self, table, row, select):
+        out = {}
+        for field in split_select(select):
+            embed = EMBED_RE.match(field)
+            if embed:
+                child, child_select = embed.groups()
+                fk = FOREIGN_KEYS.get(child)
+                if fk is None:
+                    raise ValueError(f'no relationship between {table} and {child}')
+                out[child] = [
+                    self._project(child, c, child_select or '*')
+                    for c in self._table(child) if c.get(fk) == row.get('id')
+                ]
+            elif field == '*':
+                out.update(row)
+            else:
+                out[field] = row.get(field)
+        return copy.deepcopy(out)
+
+    def select(self, table, filters, select='*', order=None):
+        with self.lock:
+            rows = [r for r in self._table(table) if all(matches(r, c, cond) for c, cond in filters)]
+            if order:
+                column, _, direction = order.partition('.')
+                # Native values, so numeric columns like order_index sort numerically; nulls sort
+                # last ascending and first descending, as in Postgres
+                desc = direction == 'desc'
+                nulls = [r for r in rows if r.get(column) is None]
+                present = sorted((r for r in rows if r.get(column) is not None), key=lambda r: r[column], reverse=desc)
+                rows = nulls + present if desc else present + nulls
+            return [self._project(table, r, select) for r in rows]
+
+    def update(self, table, filters, values):
+        with self.lock:
+            rows = [r for r in self._table(table) if all(matches(r, c, cond) for c, cond in filters)]
+            for r in rows:
+                r.update(values)
+            return copy.deepcopy(rows)
+
+
+class FaultInjector:
+    """Per-request latency, a global token-bucket rate limit and random errors, drawn per request sequence number"""
+
+    def __init__(self, latency=0, jitter=0, error_rate=0.0, rate_limit=0, seed=None):
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.tokens = rate_limit
+        self.refilled = time.monotonic()
+        self.counts = {'requests': 0, 'throttled': 0, 'errors': 0}
+
+    def admit(self):
+        """Returns None to serve the request, or (status, message) to fail it"""
+        with self.lock:
+            self.counts['requests'] += 1
+            seq = self.counts['requests']
+            # One RNG per request keeps each draw independent of which thread gets the lock first
+            rng = random.Random(f'{self.seed}:{seq}') if self.seed is not None else random.Random()
+            delay = max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+            fail = rng.random() < self.error_rate
+
+            throttled = False
+            if self.rate_limit:
+                now = time.monotonic()
+                self.tokens = min(self.rate_limit, self.tokens + (now - self.refilled) * self.rate_limit)
+                self.refilled = now
+                if self.tokens < 1:
+                    throttled = True
+                else:
+                    self.tokens -= 1
+
+            if throttled:
+                self.counts['throttled'] += 1
+            elif fail:
+                self.counts['errors'] += 1
+
+        time.sleep(delay)
+        if throttled:
+            return 429, 'rate limit exceeded'
+        if fail:
+            return 503, 'injected failure'
+        return None
+
+
+def parse_query(query):
+    """(filters, select, order, limit, offset) from a PostgREST query string"""
+    filters, select, order, limit, offset = [], '*', None, None, 0
+    for key, value in urllib.parse.parse_qsl(query, keep_blank_values=True):
+        if key == 'select':
+            select = value
+        elif key == 'order':
+            order = value
+        elif key == 'limit':
+            limit = int(value)
+        elif key == 'offset':
+            offset = int(value)
+        else:
+            filters.append((key, value))
+    return filters, select, order, limit, offset
+
+
+def make_handler(db, faults):
+    class PostgrestHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, status, body, headers=None):
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def send_error_json(self, status, message, headers=None):
+            self.send_json(status, {'message': message, 'code': str(status)}, headers)
+
+        def route(self):
+            """Table name and parsed query, or None after sending an error"""
+            url = urllib.parse.urlsplit(self.path)
+            if not url.path.startswith(REST_PREFIX):
+                self.send_error_json(404, f'unknown path {url.path}')
+                return None
+            failure = faults.admit()
+            if failure:
+                status, message = failure
+                self.send_error_json(status, message, {'Retry-After': '1'} if status == 429 else None)
+                return None
+            return url.path[len(REST_PREFIX):].strip('/'), parse_query(url.query)
+
+        def do_GET(self):
+            routed = self.route()
+            if routed is None:
+                return
+            table, (filters, select, order, limit, offset) = routed
+            try:
+                rows = db.select(table, filters, select, order)
+            except KeyError:
+                return self.send_error_json(404, f'relation "{table}" does not exist')
+            except ValueError as e:
+                return self.send_error_json(400, str(e))
+
+            total = len(rows)
+            end = total if limit is None else offset + limit
+            range_header = self.headers.get('Range')
+            if range_header:
+                m = RANGE_RE.match(range_header)
+                if not m:
+                    return self.send_error_json(400, f'invalid range "{range_header}"')
+                offset = int(m.group(1))
+                end = min(end, int(m.group(2)) + 1) if m.group(2) else end
+            if offset > 0 and offset >= total:
+                return self.send_error_json(416, 'requested range not satisfiable',
+                                            {'Content-Range': f'*/{total}'})
+
+            page = rows[offset:end]
+            last = offset + len(page) - 1
+            content_range = f'{offset}-{last}/{total}' if page else f'*/{total}'
+            status = 206 if len(page) < total else 200
+            self.send_json(status, page, {'Content-Range': content_range})
+
+        def do_PATCH(self):
+            routed = self.route()
+            if routed is None:
+                return
+            table, (filters, _, _, _, _) = routed
+            if not filters:
+                return self.send_error_json(400, 'UPDATE requires a filter')
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                values = json.loads(self.rfile.read(length) or b'{}')
+                rows = db.update(table, filters, values)
+            except KeyError:
+                return self.send_error_json(404, f'relation "{table}" does not exist')
+            except ValueError as e:
+                return self.send_error_json(400, str(e))
+
+            if 'return=representation' in (self.headers.get('Prefer') or ''):
+                return self.send_json(200, rows)
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    return PostgrestHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fixture through a minimal PostgREST-compatible API.')
+    parser.add_argument('fixture', help='Playbook snapshot or {table: [rows]} JSON file')
+    parser.add_argument('--port', type=int, default=54321, help='Port to listen on (default: 54321)')
+    parser.add_argument('--latency', type=float, default=0, help='Mean added latency per request, in ms')
+    parser.add_argument('--jitter', type=float, default=0, help='Uniform +/- jitter on the latency, in ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests failed with 503')
+    parser.add_argument('--rate-limit', type=float, default=0, help='Requests per second before answering 429 (0: unlimited)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for latency jitter and injected errors')
+    args = parser.parse_args()
+
+    db = FakeDatabase(load_fixture(args.fixture))
+    faults = FaultInjector(args.latency, args.jitter, args.error_rate, args.rate_limit, args.seed)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(db, faults))
+    server.daemon_threads = True
+    sizes = ', '.join(f'{len(rows)} {table}' for table, rows in db.tables.items())
+    print(f'Serving http://127.0.0.1:{args.port}{REST_PREFIX} ({sizes})')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"{faults.counts['requests']} requests, {faults.counts['throttled']} throttled, "
+              f"{faults.counts['errors']} failed")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,28 @@
 #!/usr/bin/env python3
 """
 Sitemap Generator for FlagSketch
-Generates sitemap.xml by scanning all HTML files in the project
+Generates sitemap.xml by scanning all HTML files in the project, plus
+changed-urls.json listing the URLs whose content changed since the last run
 """
 
 import os
+import json
 from datetime import datetime
 
+from url_feed import UrlFeed, file_hash
+
 BASE_URL = "https://flagsketch.com"
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Written by build_templates.py; lists every live play-templates page (redirect stubs excluded)
+# and which detail pages duplicate another play (their rel=canonical points at that copy)
+TEMPLATES_DIR = 'play-templates'
+URL_MAP_PATH = os.path.join(BASE_DIR, TEMPLATES_DIR, 'url-map.json')
+
+# Changed-URL feed for search engine pings / CDN purges, and the page hashes it is diffed against
+CHANGED_URLS_PATH = os.path.join(BASE_DIR, 'changed-urls.json')
+URL_HASHES_PATH = os.path.join(BASE_DIR, '.build-cache', 'sitemap-hashes.json')
+
 # Priority mappings based on URL depth/importance
 PRIORITY_MAP = {
     '/': '1.0',
@@ -27,6 +40,8 @@ EXCLUDED_PATHS = [
     '/.git/',
     '/scripts/',
     '/supabase/',
+    '/content/',
+    '/.build-cache/',
 ]
 
 def get_priority(url_path):
@@ -63,10 +78,35 @@ def get_changefreq(url_path):
         return 'monthly'
     return 'monthly'
 
+def load_template_paths():
+    """Get (play-templates URL paths, duplicate paths) from the build's URL map, or (None, None) if there isn't one"""
+    if not os.path.exists(URL_MAP_PATH):
+        return None, None
+    with open(URL_MAP_PATH, 'r') as f:
+        url_map = json.load(f)
+    return ['/play-templates/'] + sorted(url_map.get('paths', {}).values()), set(url_map.get('canonical', {}))
+
 def generate_sitemap():
     """Generate sitemap.xml from all HTML files"""
     urls = []
     today = datetime.now().strftime('%Y-%m-%d')
+    template_paths, duplicate_paths = load_template_paths()
+    feed = UrlFeed.load(BASE_URL, URL_HASHES_PATH)
+    
+    if template_paths is not None:
+        for url_path in template_paths:
+            page = os.path.join(BASE_DIR, *url_path.strip('/').split('/'), 'index.html')
+            if os.path.exists(page):
+                feed.add(url_path, file_hash(page))
+            # Duplicates are still purged when they change, but only canonical copies are listed
+            if url_path in duplicate_paths:
+                continue
+            urls.append({
+                'loc': BASE_URL + url_path,
+                'lastmod': today,
+                'changefreq': get_changefreq(url_path),
+                'priority': get_priority(url_path)
+            })
     
     # Walk through all files
     for root, dirs, files in os.walk(BASE_DIR):
@@ -74,6 +114,11 @@ def generate_sitemap():
         if any(excluded in root for excluded in EXCLUDED_PATHS):
             continue
         
+        # play-templates pages come from the URL map when available
+        if template_paths is not None and os.path.relpath(root, BASE_DIR).split(os.sep)[0] == TEMPLATES_DIR:
+            dirs[:] = []
+            continue
+        
         for file in files:
             if file.endswith('.html'):
                 full_path = os.path.join(root, file)
@@ -96,6 +141,7 @@ def generate_sitemap():
                 if any(excluded in url_path for excluded in EXCLUDED_PATHS):
                     continue
                 
+                feed.add(url_path, file_hash(full_path))
                 urls.append({
                     'loc': BASE_URL + url_path,
                     'lastmod': today,
@@ -126,6 +172,10 @@ def generate_sitemap():
         f.write(xml_content)
     
     print(f"Generated sitemap.xml with {len(urls)} URLs")
+    
+    changes = feed.write(CHANGED_URLS_PATH)
+    print(f"Generated changed-urls.json: {len(changes['added'])} added, "
+          f"{len(changes['updated'])} updated, {len(changes['removed'])} removed")
     return len(urls)
 
 if __name__ == "__main__":
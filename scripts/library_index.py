@@ -0,0 +1,106 @@
+"""
+One-pass index over the public playbook library.
+
+Groups playbooks by format, sorts each playbook's plays once and computes
+the per-format and per-collection aggregates (counts, top formations,
+last-updated) that the page generators and the stats endpoint share.
+Input playbooks are never mutated.
+"""
+
+from collections import Counter
+
+DEFAULT_FORMAT = '5v5'
+TOP_FORMATIONS_LIMIT = 5
+
+
+def normalize_format(team_size):
+    fmt = str(team_size or DEFAULT_FORMAT)
+    if 'v' not in fmt:
+        fmt = f"{fmt}v{fmt}"
+    return fmt
+
+
+def play_sort_key(play):
+    return (play.get('order_index') or 0, str(play.get('id', '')))
+
+
+def _formation(play):
+    return (play.get('data') or {}).get('formation') or ''
+
+
+def _top(counter):
+    return [{'name': name, 'count': count} for name, count in counter.most_common(TOP_FORMATIONS_LIMIT)]
+
+
+def _latest(*timestamps):
+    values = [t for t in timestamps if t]
+    return max(values) if values else None
+
+
+class LibraryIndex:
+    def __init__(self, playbooks):
+        self.by_format = {}      # fmt -> [playbook, ...] in input order
+        self.collections = {}    # playbook id -> aggregate
+        self.formats = {}        # fmt -> aggregate
+
+        format_formations = {}
+        for pb in playbooks:
+            fmt = normalize_format(pb.get('team_size'))
+            self.by_format.setdefault(fmt, []).append(pb)
+
+            plays = sorted(pb.get('plays') or [], key=play_sort_key)
+            formations = Counter(f for f in map(_formation, plays) if f)
+            format_formations.setdefault(fmt, Counter()).update(formations)
+
+            self.collections[pb['id']] = {
+                'playbook': pb,
+                'format': fmt,
+                'plays': plays,
+                'play_count': len(plays),
+                'top_formations': _top(formations),
+                'last_updated': _latest(pb.get('updated_at'), *(p.get('updated_at') for p in plays)),
+            }
+
+        for fmt, collections in self.by_format.items():
+            stats = [self.collections[pb['id']] for pb in collections]
+            self.formats[fmt] = {
+                'collection_count': len(stats),
+                'play_count': sum(c['play_count'] for c in stats),
+                'top_formations': _top(format_formations[fmt]),
+                'last_updated': _latest(*(c['last_updated'] for c in stats)),
+            }
+
+    def format_names(self):
+        return sorted(self.by_format)
+
+    def plays(self, playbook):
+        """Plays of `playbook` sorted by order_index"""
+        return self.collections[playbook['id']]['plays']
+
+    def play_count(self, playbook):
+        return self.collections[playbook['id']]['play_count']
+
+    def to_stats(self, urls):
+        """Library-wide stats document for play-templates/stats.json"""
+        formats = {}
+        for fmt in self.format_names():
+            collections = []
+            for pb in self.by_format[fmt]:
+                c = self.collections[pb['id']]
+                collections.append({
+                    'id': pb['id'],
+                    'title': pb['title'],
+                    'url': urls.path(pb['id']),
+                    'play_count': c['play_count'],
+                    'top_formations': c['top_formations'],
+                    'last_updated': c['last_updated'],
+                })
+            formats[fmt] = dict(self.formats[fmt], collections=collections)
+
+        return {
+            'format_count': len(formats),
+            'collection_count': len(self.collections),
+            'play_count': sum(f['play_count'] for f in self.formats.values()),
+            'last_updated': _latest(*(f['last_updated'] for f in self.formats.values())),
+            'formats': formats,
+        }
@@ -0,0 +1,137 @@
+"""
+Page dependency graph for incremental builds.
+
+Every generated page records the inputs it was rendered from: plays,
+playbooks, config entries (SEO_CONTENT / COLLECTION_CONTENT keys), template
+fragments (every function of the build module a page's generator reaches,
+found by walking the names its code references) and the module constants
+they read, assets and build options.
+Each input is reduced to a content hash. Comparing the graph with the one
+saved by the previous build gives the minimal set of pages to regenerate,
+together with the reason each one was picked.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+
+GRAPH_VERSION = 1
+
+
+def content_hash(value):
+    payload = json.dumps(value, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def code_fingerprint(fn):
+    """Hash of a function's bytecode, constants and names (line numbers ignored)"""
+    code = fn.__code__
+    parts = []
+    stack = [code]
+    while stack:
+        c = stack.pop()
+        parts.append(c.co_code.hex())
+        parts.append(repr(c.co_names))
+        for const in c.co_consts:
+            if hasattr(const, 'co_code'):
+                stack.append(const)
+            else:
+                parts.append(repr(const))
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def referenced_names(code):
+    """Global and attribute names used by a code object, including nested functions and comprehensions"""
+    names = set()
+    stack = [code]
+    while stack:
+        c = stack.pop()
+        names.update(c.co_names)
+        stack.extend(const for const in c.co_consts if hasattr(const, 'co_code'))
+    return names
+
+
+def _plain_data(value):
+    return value is None or isinstance(value, (str, int, float, bool, list, tuple, dict))
+
+
+def code_dependencies(fn, namespace, skip=()):
+    """
+    ({function name: fingerprint}, {constant name: value}) for `fn` and every function of
+    its module it reaches through `namespace` (the module globals), transitively.
+
+    Names in `skip` (per-run state, config tracked per entry) are not followed.
+    Objects that aren't plain data (modules, classes, helper instances) are ignored.
+    """
+    module = fn.__module__
+    functions = {}
+    constants = {}
+    stack = [fn]
+    while stack:
+        f = stack.pop()
+        if f.__name__ in functions:
+            continue
+        functions[f.__name__] = code_fingerprint(f)
+        for name in sorted(referenced_names(f.__code__)):
+            if name in skip or name not in namespace:
+                continue
+            value = namespace[name]
+            # contextlib/functools wrappers carry the decorated function in __wrapped__
+            target = inspect.unwrap(value) if callable(value) else value
+            if inspect.isfunction(target) and target.__module__ == module:
+                stack.append(target)
+            elif _plain_data(value):
+                constants[name] = value
+    return functions, constants
+
+
+class DependencyGraph:
+    def __init__(self):
+        self.pages = {}    # page key -> sorted list of dependency keys
+        self.hashes = {}   # dependency key -> content hash
+
+    @classmethod
+    def load(cls, path):
+        """Previous build's graph, or None if there isn't a usable one"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != GRAPH_VERSION:
+            return None
+        graph = cls()
+        graph.pages = data['pages']
+        graph.hashes = data['hashes']
+        return graph
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump({'version': GRAPH_VERSION, 'pages': {str(k): v for k, v in self.pages.items()}, 'hashes': self.hashes}, f)
+
+    def add_page(self, page, deps):
+        self.pages[page] = sorted(set(deps))
+
+    def set(self, dep, value):
+        """Record the current content of a dependency"""
+        self.hashes[dep] = content_hash(value)
+
+    def changed_pages(self, previous):
+        """{page: [reason, ...]} for pages that must be regenerated relative to `previous`"""
+        changed = {}
+        for page, deps in self.pages.items():
+            # Keys of a loaded graph are strings, while ids in the library may be numbers
+            old_deps = previous.pages.get(str(page)) if previous else None
+            if old_deps is None:
+                changed[page] = ['new page']
+                continue
+
+            old_deps = set(old_deps)
+            reasons = [
+                f'{dep} changed' if dep in old_deps else f'{dep} added' for dep in deps
+                if dep not in old_deps or previous.hashes.get(dep) != self.hashes.get(dep)
+            ]
+            reasons += [f'{dep} removed' for dep in sorted(old_deps - set(deps))]
+            if reasons:
+                changed[page] = reasons
+        return changed
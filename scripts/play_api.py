@@ -0,0 +1,86 @@
+"""
+Static JSON API for public play templates.
+
+Each public play is written as a compact JSON file (already upgraded to the
+current play-data schema, see play_migrations.py)
+and each playbook as a bundle of its plays. File names carry a content hash
+so they can be served with immutable cache headers; index.json (short
+cache) maps ids to the current hashed paths.
+"""
+
+import hashlib
+import json
+
+API_VERSION = 1
+HASH_LENGTH = 10
+
+
+def _drop_nulls(value):
+    # Ingest validation fills absent optional fields with None; keep them out of the API
+    if isinstance(value, dict):
+        return {k: _drop_nulls(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_nulls(v) for v in value]
+    return value
+
+
+def normalized_data(play):
+    """Copy of play['data'] without the null fields validation filled in; never mutates the play"""
+    return _drop_nulls(play.get('data') or {})
+
+
+def play_document(fmt, play):
+    return {
+        'v': API_VERSION,
+        'id': play['id'],
+        'name': play['name'],
+        'description': play.get('description') or '',
+        'team_size': fmt,
+        'data': normalized_data(play),
+    }
+
+
+def _dumps(doc):
+    return json.dumps(doc, separators=(',', ':'), sort_keys=True)
+
+
+def hashed_name(prefix, content):
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    return f'{prefix}.{digest}.json'
+
+
+class PlayApi:
+    """Collects play/collection documents during the build and names them by content hash"""
+
+    def __init__(self):
+        self.files = {}        # relative path -> content
+        self.plays = {}        # play id -> relative path
+        self.collections = {}  # playbook id -> relative path
+
+    def add_collection(self, fmt, playbook, plays):
+        docs = []
+        for play in plays:
+            doc = play_document(fmt, play)
+            content = _dumps(doc)
+            path = f"plays/{hashed_name(play['id'], content)}"
+            self.files[path] = content
+            self.plays[play['id']] = path
+            docs.append(doc)
+
+        content = _dumps({
+            'v': API_VERSION,
+            'id': playbook['id'],
+            'title': playbook['title'],
+            'team_size': fmt,
+            'plays': docs,
+        })
+        path = f"collections/{hashed_name(playbook['id'], content)}"
+        self.files[path] = content
+        self.collections[playbook['id']] = path
+
+    def index(self):
+        return _dumps({
+            'v': API_VERSION,
+            'plays': self.plays,
+            'collections': self.collections,
+        })
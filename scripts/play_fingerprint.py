@@ -0,0 +1,125 @@
+"""
+Geometry fingerprints for duplicate and near-duplicate play detection.
+
+Plays (already upgraded to percentage coordinates, 100x70, at ingest) are
+rounded and put in a canonical order so the same drawing hashes identically
+no matter which playbook it was copied into. Near-duplicates are found by bucketing plays on
+their structure and comparing coordinates within a tolerance.
+"""
+
+import hashlib
+import json
+import math
+
+# Max coordinate deviation (field units, 100x70) for two plays to count as near-duplicates
+NEAR_DUPLICATE_TOLERANCE = 1.0
+
+COORD_PRECISION = 2
+
+
+def _point(pt):
+    # Always floats: JSON hashes 50 and 50.0 differently, and migrated data is float while new data may be int
+    return (
+        float(round(pt['x'], COORD_PRECISION)),
+        float(round(pt['y'], COORD_PRECISION)),
+    )
+
+
+def normalize_geometry(play):
+    """Return a canonical, JSON-serializable form of a play's drawing (validated by play_schema.py)"""
+    play_data = play['data']
+    if not play_data:
+        return {'players': [], 'icons': []}
+
+    norm_players = []
+    for p in play_data['players']:
+        norm_players.append({
+            'pos': _point(p),
+            'color': (p['color'] or '').lower(),
+            'label': p['label'] or '',
+            'route': [_point(pt) for pt in p['route']],
+        })
+    norm_players.sort(key=lambda p: (p['label'], p['pos']))
+
+    icons = sorted(
+        (icon['type'] or 'football',) + _point(icon)
+        for icon in play_data['icons']
+    )
+
+    return {'players': norm_players, 'icons': icons}
+
+
+def exact_hash(geometry):
+    payload = json.dumps(geometry, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def structure_key(geometry):
+    """Coarse bucket key: plays can only be near-duplicates if this matches"""
+    return (
+        tuple((p['label'], p['color'], len(p['route'])) for p in geometry['players']),
+        tuple(icon[0] for icon in geometry['icons']),
+    )
+
+
+def _max_deviation(a, b):
+    worst = 0
+    for pa, pb in zip(a['players'], b['players']):
+        for (ax, ay), (bx, by) in zip([pa['pos']] + pa['route'], [pb['pos']] + pb['route']):
+            worst = max(worst, math.hypot(ax - bx, ay - by))
+    for ia, ib in zip(a['icons'], b['icons']):
+        worst = max(worst, math.hypot(ia[1] - ib[1], ia[2] - ib[2]))
+    return worst
+
+
+class DuplicateIndex:
+    """Groups plays by exact geometry hash and links near-duplicate groups"""
+
+    def __init__(self, tolerance=NEAR_DUPLICATE_TOLERANCE):
+        self.tolerance = tolerance
+        self.groups = {}         # exact hash -> [key, ...] in insertion order
+        self.geometries = {}     # exact hash -> geometry
+        self.buckets = {}        # structure key -> [exact hash, ...]
+        self.near = {}           # exact hash -> exact hash of the group it duplicates
+        self.fingerprints = {}   # key -> exact hash
+
+    def add(self, key, play):
+        geometry = normalize_geometry(play)
+        fp = exact_hash(geometry)
+        self.fingerprints[key] = fp
+
+        if fp in self.groups:
+            self.groups[fp].append(key)
+            return fp
+
+        self.groups[fp] = [key]
+        self.geometries[fp] = geometry
+        bucket = self.buckets.setdefault(structure_key(geometry), [])
+        for other in bucket:
+            if _max_deviation(geometry, self.geometries[other]) <= self.tolerance:
+                self.near[fp] = self.near.get(other, other)
+                break
+        bucket.append(fp)
+        return fp
+
+    def canonical_map(self, rank):
+        """
+        Map every duplicated key to the key of its canonical copy.
+
+        `rank` orders candidate keys; the lowest ranked key in each
+        (exact or near) duplicate cluster becomes canonical.
+        """
+        clusters = {}
+        for fp, keys in self.groups.items():
+            root = self.near.get(fp, fp)
+            clusters.setdefault(root, []).extend(keys)
+
+        canonical = {}
+        for keys in clusters.values():
+            if len(keys) < 2:
+                continue
+            best = min(keys, key=rank)
+            for key in keys:
+                if key != best:
+                    canonical[key] = best
+        return canonical
@@ -0,0 +1,79 @@
+"""
+Versioned migrations for play drawings.
+
+Play data (`plays.data`) and formations (`formations.default_formation`)
+carry a `schema_version`; data written before versioning counts as version 0.
+Each schema change is one function registered with `@migration(n, ...)` that
+upgrades data from version n-1 to n. `upgrade()` applies every pending
+migration in one pass: the build calls it lazily on each play it reads, and
+migrate_plays.py calls it in bulk to rewrite the database. The app writes
+PLAY_SCHEMA_VERSION (js/play-schema.js) on save, which must equal
+current_version().
+"""
+
+import copy
+
+SCHEMA_VERSION_KEY = 'schema_version'
+
+# (version, description, function), in version order
+MIGRATIONS = []
+
+
+def migration(version, description):
+    def register(fn):
+        if version != len(MIGRATIONS) + 1:
+            raise ValueError(f'migration {version} registered out of order (expected {len(MIGRATIONS) + 1})')
+        MIGRATIONS.append((version, description, fn))
+        return fn
+    return register
+
+
+def current_version():
+    return len(MIGRATIONS)
+
+
+def data_version(data):
+    return data.get(SCHEMA_VERSION_KEY) or 0
+
+
+def upgrade(data):
+    """
+    Return (data, changed) with all pending migrations applied.
+
+    `data` is never mutated; a deep copy is upgraded when anything is pending.
+    Non-dict values (missing drawings) are returned unchanged.
+    """
+    if not isinstance(data, dict):
+        return data, False
+    version = data_version(data)
+    if version >= current_version():
+        return data, False
+
+    data = copy.deepcopy(data)
+    for _, _, fn in MIGRATIONS[version:]:
+        data = fn(data)
+    data[SCHEMA_VERSION_KEY] = current_version()
+    return data, True
+
+
+def _scale_point(pt, divisor):
+    # Divide rather than multiply by 0.1: 3 / 10 is 0.3, 3 * 0.1 is 0.30000000000000004
+    pt['x'] = pt.get('x', 0) / divisor
+    pt['y'] = pt.get('y', 0) / divisor
+
+
+# --- Migrations ---
+
+@migration(1, 'pixel coordinates (1000x700) to percentage coordinates (100x70)')
+def percentage_coordinates(data):
+    # Unversioned data doesn't say which system it uses, so this is the one place the magnitude heuristic remains
+    players = data.get('players') or []
+    if not any(p.get('x', 0) > 100 or p.get('y', 0) > 70 for p in players):
+        return data
+    for p in players:
+        _scale_point(p, 10)
+        for pt in p.get('route') or []:
+            _scale_point(pt, 10)
+    for icon in data.get('icons') or []:
+        _scale_point(icon, 10)
+    return data
@@ -0,0 +1,196 @@
+"""
+Ingest-time validation for public playbooks and plays.
+
+The schema is declared once and compiled into nested check functions at
+import time. Each record is validated (and normalized) exactly once when the
+build starts; records that fail are quarantined with the reasons instead of
+crashing the build halfway through rendering. Normalized plays always have
+`data.players`, `data.icons` and a `route` list on every player, so the
+renderers can index them directly.
+"""
+
+import math
+
+_MISSING = object()
+
+
+class ValidationError(Exception):
+    def __init__(self, path, message):
+        super().__init__(f'{path}: {message}')
+        self.path = path
+        self.message = message
+
+
+# --- Check combinators (each returns a compiled check(value, path) -> normalized value) ---
+
+def number():
+    def check(value, path):
+        if type(value) not in (int, float) or not math.isfinite(value):
+            raise ValidationError(path, f'expected a number, got {value!r}')
+        return value
+    return check
+
+
+def integer(minimum=None):
+    def check(value, path):
+        if type(value) is not int:
+            raise ValidationError(path, f'expected an integer, got {value!r}')
+        if minimum is not None and value < minimum:
+            raise ValidationError(path, f'must be at least {minimum}, got {value!r}')
+        return value
+    return check
+
+
+def string(allow_empty=True):
+    def check(value, path):
+        if not isinstance(value, str):
+            raise ValidationError(path, f'expected a string, got {type(value).__name__}')
+        if not allow_empty and not value.strip():
+            raise ValidationError(path, 'must not be empty')
+        return value
+    return check
+
+
+def identifier():
+    def check(value, path):
+        if isinstance(value, bool) or not isinstance(value, (str, int)) or value == '':
+            raise ValidationError(path, f'expected an id, got {value!r}')
+        return value
+    return check
+
+
+def anything():
+    return lambda value, path: value
+
+
+def optional(inner, default=None):
+    """Missing or null values become `default` (copied if it is a list/dict)"""
+    def check(value, path):
+        if value is _MISSING or value is None:
+            return type(default)() if isinstance(default, (list, dict)) else default
+        return inner(value, path)
+    return check
+
+
+def list_of(item):
+    def check(value, path):
+        if not isinstance(value, list):
+            raise ValidationError(path, f'expected a list, got {type(value).__name__}')
+        return [item(v, f'{path}[{i}]') for i, v in enumerate(value)]
+    return check
+
+
+def record(fields):
+    """Dict with the given fields checked (always present in the result); unknown keys are kept as-is"""
+    items = tuple(fields.items())
+
+    def check(value, path):
+        if not isinstance(value, dict):
+            raise ValidationError(path, f'expected an object, got {type(value).__name__}')
+        out = dict(value)
+        for name, field_check in items:
+            out[name] = field_check(value.get(name, _MISSING), f'{path}.{name}')
+        return out
+    return check
+
+
+def required(inner):
+    def check(value, path):
+        if value is _MISSING:
+            raise ValidationError(path, 'is required')
+        return inner(value, path)
+    return check
+
+
+# --- Schema ---
+
+POINT = record({
+    'x': required(number()),
+    'y': required(number()),
+})
+
+PLAYER = record({
+    'x': required(number()),
+    'y': required(number()),
+    'color': optional(string()),
+    'label': optional(string()),
+    'route': optional(list_of(POINT), default=[]),
+})
+
+ICON = record({
+    'x': required(number()),
+    'y': required(number()),
+    'type': optional(string()),
+})
+
+PLAY_DATA = record({
+    'schema_version': optional(integer(minimum=0)),
+    'formation': optional(string()),
+    'players': optional(list_of(PLAYER), default=[]),
+    'icons': optional(list_of(ICON), default=[]),
+})
+
+PLAY = record({
+    'id': required(identifier()),
+    'name': required(string(allow_empty=False)),
+    'description': optional(string()),
+    'order_index': optional(number()),
+    'data': optional(PLAY_DATA),
+})
+
+PLAYBOOK = record({
+    'id': required(identifier()),
+    'title': required(string(allow_empty=False)),
+    'team_size': optional(anything()),
+    'description': optional(string()),
+    'default_formation': optional(anything()),
+})
+
+
+def validate_library(playbooks):
+    """
+    Validate every playbook and play once.
+
+    Returns (clean_playbooks, quarantine) where quarantine is a list of
+    {'kind', 'id', 'playbook_id', 'error'} entries for the dropped records.
+    """
+    clean = []
+    quarantine = []
+    seen_play_ids = set()
+
+    if not isinstance(playbooks, list):
+        return [], [{'kind': 'library', 'id': None, 'playbook_id': None, 'error': 'expected a list of playbooks'}]
+
+    for i, raw in enumerate(playbooks):
+        pb_id = raw.get('id') if isinstance(raw, dict) else None
+        try:
+            pb = PLAYBOOK(raw, f'playbooks[{i}]')
+        except ValidationError as e:
+            quarantine.append({'kind': 'playbook', 'id': pb_id, 'playbook_id': pb_id, 'error': str(e)})
+            continue
+
+        plays = []
+        raw_plays = raw.get('plays') or []
+        if not isinstance(raw_plays, list):
+            quarantine.append({'kind': 'playbook', 'id': pb_id, 'playbook_id': pb_id,
+                               'error': f'playbooks[{i}].plays: expected a list'})
+            raw_plays = []
+        for j, raw_play in enumerate(raw_plays):
+            play_id = raw_play.get('id') if isinstance(raw_play, dict) else None
+            try:
+                play = PLAY(raw_play, f'playbooks[{i}].plays[{j}]')
+            except ValidationError as e:
+                quarantine.append({'kind': 'play', 'id': play_id, 'playbook_id': pb_id, 'error': str(e)})
+                continue
+            # Ids key URLs, fingerprints and API files, so they must be unique
+            if play_id in seen_play_ids:
+                quarantine.append({'kind': 'play', 'id': play_id, 'playbook_id': pb_id,
+                                   'error': f'playbooks[{i}].plays[{j}].id: duplicate id'})
+                continue
+            seen_play_ids.add(play_id)
+            plays.append(play)
+
+        pb['plays'] = plays
+        clean.append(pb)
+
+    return clean, quarantine
@@ -0,0 +1,108 @@
+"""
+Static search index for the generated play-templates tree.
+
+Builds an inverted index over play names, descriptions, playbook titles,
+formation names, player counts and route counts. Tokens are sharded by
+their first character so the client only downloads the shard it needs.
+Each shard carries the metadata of the plays its postings point at, keyed
+by play id, so a query never loads the whole library and adding or removing
+a play only rewrites the shards holding its tokens.
+"""
+
+import json
+import re
+
+INDEX_VERSION = 2
+
+# Tokens shorter than this are dropped (except facet tokens like "players:5")
+MIN_TOKEN_LENGTH = 2
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+    'is', 'it', 'of', 'on', 'or', 'the', 'this', 'to', 'with',
+}
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def tokenize(text):
+    """Split free text into lowercase search tokens"""
+    if not text:
+        return []
+    text = TAG_RE.sub(' ', str(text).lower())
+    return [
+        t for t in TOKEN_RE.findall(text)
+        if len(t) >= MIN_TOKEN_LENGTH and t not in STOP_WORDS
+    ]
+
+
+def shard_key(token):
+    """Shard by first character; digits share one shard"""
+    first = token[0]
+    return '0' if first.isdigit() else first
+
+
+class SearchIndex:
+    """Accumulates documents during the build and emits index shards"""
+
+    def __init__(self):
+        self.docs = {}       # play id -> result metadata
+        self.postings = {}   # token -> [[play id, weight], ...]
+
+    def add_play(self, fmt, playbook, play, url):
+        play_data = play.get('data') or {}
+        players = play_data.get('players') or []
+        formation = play_data.get('formation') or ''
+        route_count = sum(1 for p in players if p.get('route'))
+
+        doc_id = str(play['id'])
+        self.docs[doc_id] = {
+            'u': url,
+            'n': play['name'],
+            'p': playbook['title'],
+            'f': fmt,
+            'fm': formation,
+            'pc': len(players),
+            'rc': route_count,
+        }
+
+        # Weighted fields: name > formation > playbook > description
+        weights = {}
+        for text, weight in (
+            (play['name'], 4),
+            (formation, 3),
+            (playbook['title'], 2),
+            (play.get('description'), 1),
+        ):
+            for token in tokenize(text):
+                weights[token] = max(weights.get(token, 0), weight)
+
+        # Facet tokens (exact match only on the client)
+        weights[f'format:{fmt.lower()}'] = 1
+        weights[f'players:{len(players)}'] = 1
+        weights[f'routes:{route_count}'] = 1
+
+        for token, weight in weights.items():
+            self.postings.setdefault(token, []).append([doc_id, weight])
+
+    def build_files(self):
+        """Return {filename: content} for the manifest and every shard"""
+        shards = {}
+        for token in sorted(self.postings):
+            key = shard_key(token)
+            shard = shards.setdefault(key, {'tokens': {}, 'docs': {}})
+            shard['tokens'][token] = self.postings[token]
+            for doc_id, _ in self.postings[token]:
+                shard['docs'][doc_id] = self.docs[doc_id]
+
+        files = {}
+        for key, shard in shards.items():
+            files[f'{key}.json'] = json.dumps(shard, separators=(',', ':'), sort_keys=True)
+
+        manifest = {
+            'version': INDEX_VERSION,
+            'shards': sorted(shards.keys()),
+        }
+        files['manifest.json'] = json.dumps(manifest, separators=(',', ':'))
+        return files
@@ -0,0 +1,113 @@
+"""
+Source files for the strategy/ articles and section pages.
+
+Each page is an HTML fragment under content/strategy/ with a small
+front-matter header:
+
+    ---
+    layout: article
+    title: Zone vs. Man Defense: Which is Best for Youth Flag Football?
+    description: Should you run Man or Zone defense in flag football? ...
+    breadcrumb: Zone vs. Man Defense
+    ---
+    <h1>...</h1>
+    ...
+    <!-- schema -->
+    <script type="application/ld+json">...</script>
+
+`index.html` renders at its directory's URL, any other file at
+/<dir>/<stem>/. Everything after the `<!-- schema -->` marker is emitted
+after the page body (FAQ/HowTo structured data). The shared head, nav,
+footer, breadcrumbs and Article/BreadcrumbList schemas come from the
+build (see build_templates.py).
+"""
+
+import os
+
+FRONT_MATTER_DELIMITER = '---'
+SCHEMA_MARKER = '<!-- schema -->'
+LAYOUTS = ('article', 'section')
+REQUIRED_FIELDS = ('layout', 'title', 'description', 'breadcrumb')
+ARTICLE_FIELDS = ('published', 'sidebar_heading', 'sidebar_text', 'sticky_cta')
+
+
+class SourceError(Exception):
+    def __init__(self, path, message):
+        super().__init__(f'{path}: {message}')
+
+
+class StrategyPage:
+    def __init__(self, url_path, source_path, meta, body, schema):
+        self.url_path = url_path
+        self.source_path = source_path
+        self.meta = meta
+        self.body = body
+        self.schema = schema
+
+    @property
+    def parent_path(self):
+        """URL of the enclosing page (section or strategy hub), or None for the hub itself"""
+        trimmed = self.url_path.rstrip('/')
+        if trimmed.count('/') <= 1:
+            return None
+        return trimmed.rsplit('/', 1)[0] + '/'
+
+    def to_dependency(self):
+        return [self.meta, self.body, self.schema]
+
+
+def parse_source(text, path):
+    """(meta, body, schema) from a source file's text"""
+    lines = text.split('\n')
+    if not lines or lines[0].strip() != FRONT_MATTER_DELIMITER:
+        raise SourceError(path, 'missing front matter')
+    try:
+        end = next(i for i in range(1, len(lines)) if lines[i].strip() == FRONT_MATTER_DELIMITER)
+    except StopIteration:
+        raise SourceError(path, 'unterminated front matter')
+
+    meta = {}
+    for line in lines[1:end]:
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(':')
+        if not sep:
+            raise SourceError(path, f'expected "key: value", got {line!r}')
+        meta[key.strip()] = value.strip()
+
+    required = REQUIRED_FIELDS + (ARTICLE_FIELDS if meta.get('layout') == 'article' else ())
+    missing = [field for field in required if not meta.get(field)]
+    if missing:
+        raise SourceError(path, f"missing {', '.join(missing)}")
+    if meta['layout'] not in LAYOUTS:
+        raise SourceError(path, f"unknown layout {meta['layout']!r}")
+
+    body, _, schema = '\n'.join(lines[end + 1:]).partition(SCHEMA_MARKER)
+    return meta, body.strip('\n'), schema.strip('\n')
+
+
+def url_path_for(source_dir, source_path, url_root):
+    rel = os.path.relpath(source_path, source_dir)
+    parts = rel.split(os.sep)
+    stem = os.path.splitext(parts.pop())[0]
+    if stem != 'index':
+        parts.append(stem)
+    return url_root + ''.join(part + '/' for part in parts)
+
+
+def load_pages(source_dir, url_root):
+    """Every page under `source_dir`, sorted by URL"""
+    pages = []
+    if not os.path.isdir(source_dir):
+        return pages
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.html'):
+                continue
+            path = os.path.join(root, name)
+            with open(path, 'r') as f:
+                meta, body, schema = parse_source(f.read(), path)
+            pages.append(StrategyPage(url_path_for(source_dir, path, url_root), path, meta, body, schema))
+    pages.sort(key=lambda page: page.url_path)
+    return pages
@@ -0,0 +1,66 @@
+"""
+Changed-URL feed for search engine pings and CDN purges.
+
+Each run records a content hash per published URL and compares it with the
+hashes saved by the previous run. The feed lists URLs that were added,
+updated or removed; `urlList` is the union, ready to submit as an IndexNow
+payload (add the `key`) or to hand to a CDN purge. Removed URLs are included
+because caches and crawlers still hold the old content.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+FEED_VERSION = 1
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class UrlFeed:
+    def __init__(self, base_url, state_path, previous=None):
+        self.base_url = base_url
+        self.state_path = state_path
+        self.previous = previous or {}  # URL path -> content hash from the last run
+        self.hashes = {}
+
+    @classmethod
+    def load(cls, base_url, state_path):
+        previous = None
+        if os.path.exists(state_path):
+            with open(state_path, 'r') as f:
+                previous = json.load(f)
+        return cls(base_url, state_path, previous)
+
+    def add(self, url_path, content_hash):
+        self.hashes[url_path] = content_hash
+
+    def diff(self):
+        return {
+            'added': sorted(p for p in self.hashes if p not in self.previous),
+            'updated': sorted(p for p, h in self.hashes.items() if p in self.previous and self.previous[p] != h),
+            'removed': sorted(p for p in self.previous if p not in self.hashes),
+        }
+
+    def write(self, feed_path):
+        """Write the feed and save the current hashes for the next run; returns the diff"""
+        changes = self.diff()
+        feed = {
+            'version': FEED_VERSION,
+            'generated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'host': self.base_url.split('://', 1)[-1],
+        }
+        for kind, paths in changes.items():
+            feed[kind] = [self.base_url + p for p in paths]
+        feed['urlList'] = sorted(feed['added'] + feed['updated'] + feed['removed'])
+
+        with open(feed_path, 'w') as f:
+            json.dump(feed, f, indent=1)
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        with open(self.state_path, 'w') as f:
+            json.dump(dict(sorted(self.hashes.items())), f, indent=1)
+        return changes
@@ -0,0 +1,155 @@
+"""
+Stable URL map for the generated play-templates tree.
+
+Every format, playbook and play gets exactly one path, computed once per
+build. Slug collisions inside the same parent are resolved with numeric
+suffixes (-2, -3, ...), and the previous build's map is used so existing
+pages keep their exact path (suffix included) when siblings are added,
+removed or renamed. A path a live page owned before is never handed to
+another page. When a title changes the old path is kept as an alias so a
+redirect stub can be written for it.
+Pages that duplicate another play record the path of their canonical copy,
+so the sitemap and search can leave them out.
+"""
+
+import json
+import os
+import re
+
+ROOT_PATH = '/play-templates/'
+MAP_VERSION = 1
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r'[^\w\-]+')
+_DASHES_RE = re.compile(r'\-\-+')
+
+
+def slugify(text):
+    text = str(text).lower()
+    text = _WHITESPACE_RE.sub('-', text)
+    text = _NON_WORD_RE.sub('', text)
+    text = _DASHES_RE.sub('-', text)
+    return text.strip('-')
+
+
+def format_key(fmt):
+    return f'format:{fmt}'
+
+
+class UrlMap:
+    def __init__(self, previous=None):
+        previous = previous or {}
+        self.previous_paths = previous.get('paths', {})
+        self.paths = {}
+        self.slugs = {}
+        self.aliases = dict(previous.get('aliases', {}))
+        self.reserved = {}   # path -> key of the live page that owned it (or redirects from it) before
+        self.canonical = {}  # duplicate page path -> canonical page path, recomputed every build
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != MAP_VERSION:
+            return cls()
+        return cls(data)
+
+    def save(self, path):
+        data = {
+            'version': MAP_VERSION,
+            'paths': dict(sorted(self.paths.items())),
+            'aliases': dict(sorted(self.aliases.items())),
+            'canonical': dict(sorted(self.canonical.items())),
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=1)
+
+    def path(self, key):
+        return self.paths[key]
+
+    def slug(self, key):
+        return self.slugs[key]
+
+    def _previous_slug(self, key, parent_path, base):
+        """The slug `key` had under `parent_path` last build, if it still fits its title (base or base-N)"""
+        old = self.previous_paths.get(key)
+        if not old or not old.startswith(parent_path):
+            return None
+        slug = old[len(parent_path):-1]
+        if slug == base or (slug.startswith(base + '-') and slug[len(base) + 1:].isdigit()):
+            return slug
+        return None
+
+    def _assign(self, parent_path, items):
+        """
+        Give each (key, title) in `items` a unique child path under `parent_path`.
+        Items keep their exact previous path when it still fits their title; the
+        rest get the first free suffix that no other live page owned before.
+        """
+        wanted = [(key, slugify(title) or 'untitled') for key, title in items]
+        slugs = {}
+        taken = set()
+        for key, base in wanted:
+            slug = self._previous_slug(key, parent_path, base)
+            if slug is not None and slug not in taken:
+                slugs[key] = slug
+                taken.add(slug)
+
+        for key, base in wanted:
+            if key in slugs:
+                continue
+            slug = base
+            n = 2
+            while slug in taken or self.reserved.get(f'{parent_path}{slug}/', key) != key:
+                slug = f'{base}-{n}'
+                n += 1
+            slugs[key] = slug
+            taken.add(slug)
+
+        for key, _ in wanted:
+            self._set(key, slugs[key], f'{parent_path}{slugs[key]}/')
+
+    def _set(self, key, slug, path):
+        old = self.previous_paths.get(key)
+        if old and old != path:
+            self.aliases[old] = key
+        self.aliases.pop(path, None)
+        self.slugs[key] = slug
+        self.paths[key] = path
+
+    def build(self, library):
+        """Compute paths for every format/playbook/play in a LibraryIndex"""
+        live = set()
+        for fmt in library.format_names():
+            live.add(format_key(fmt))
+            for pb in library.by_format[fmt]:
+                live.add(pb['id'])
+                live.update(p['id'] for p in library.plays(pb))
+        self.reserved = {old: key for old, key in self.aliases.items() if key in live}
+        self.reserved.update((path, key) for key, path in self.previous_paths.items() if key in live)
+
+        for fmt in library.format_names():
+            fmt_path = f'{ROOT_PATH}{fmt}/'
+            self._set(format_key(fmt), fmt, fmt_path)
+
+            collections = library.by_format[fmt]
+            self._assign(fmt_path, [(pb['id'], pb['title']) for pb in collections])
+
+            for pb in collections:
+                plays = library.plays(pb)
+                self._assign(self.paths[pb['id']], [(p['id'], p['name']) for p in plays])
+
+        # Drop aliases whose target disappeared or that now collide with a live page
+        live = set(self.paths.values())
+        self.aliases = {
+            old: key for old, key in self.aliases.items()
+            if key in self.paths and old not in live
+        }
+        return self
+
+    def redirects(self):
+        """Yield (old_path, new_path) for every alias that needs a redirect stub"""
+        for old, key in sorted(self.aliases.items()):
+            yield old, self.paths[key]